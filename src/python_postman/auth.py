@@ -2,6 +2,9 @@ from requests.auth import HTTPBasicAuth, AuthBase
 
 from .config import Auth as ConfigAuth
 
+# Postman auth types that map onto an Auth property of the same name.
+_HTTP_AUTH_TYPES = frozenset({"noauth", "basic", "apikey", "bearer"})
+
 
 class BearerAuth(AuthBase):
     def __init__(self, token):
@@ -42,7 +45,7 @@ class Auth:
         )
 
         self.http_auth = (
-            self.noauth or self.basic or self.apikey or self.bearer if auth else None
+            getattr(self, self.type) if self.type in _HTTP_AUTH_TYPES else None
         )
 
     @property
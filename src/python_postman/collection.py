@@ -27,10 +27,11 @@ class Collection:
         self._prerequest = self._events.prerequest
         self._items: Items = Items(items=self._collection.items)
         self._requests = self._items.requests()
+        variables = self._variables.as_dict
         for request in self._requests:
             request.auth = self._auth if not request.auth else request.auth
             if request.url:
                 template: str = CustomTemplate(request.url.base).safe_substitute(
-                    self._variables.as_dict
+                    variables
                 )
                 request.url.base_url = template
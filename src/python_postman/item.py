@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from .config import Item
 from .request import Request
@@ -17,12 +17,19 @@ class Items:
     def __init__(self, items: List[Item]) -> None:
         self.items = items
 
-    def requests(self) -> List[Request]:
-        requests = []
-        for item in self.items:
+    def iter_requests(self) -> Iterator[Request]:
+        if not self.items:
+            return
+
+        # Walk folders depth first with an explicit stack, children are pushed
+        # in reverse so requests keep their collection order.
+        stack = list(reversed(self.items))
+        while stack:
+            item = stack.pop()
             if item.request:
-                request = Request(item=item)
-                requests.append(request)
+                yield Request(item=item)
             if item.item:
-                requests.extend(Items(items=item.item).requests())
-        return requests
+                stack.extend(reversed(item.item))
+
+    def requests(self) -> List[Request]:
+        return list(self.iter_requests())
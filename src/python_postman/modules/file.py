@@ -12,10 +12,33 @@ from typing import Iterator
 from datetime import datetime
 from .logger import Log
 
+log = Log()
+
+_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/bmp": ".bmp",
+    "audio/mp3": ".mp3",
+    "audio/wav": ".wav",
+    "audio/aac": ".aac",
+    "video/mp4": ".mp4",
+    "video/avi": ".avi",
+    "video/mkv": ".mkv",
+    "text/html": ".html",
+    "text/plain": ".txt",
+    "text/javascript": ".js",
+    "application/pdf": ".pdf",
+    "application/json": ".json",
+    "application/xml": ".xml",
+    "application/csv": ".csv",
+    "application/x-zip-compressed": ".zip",
+}
+
 
 class File:
     def __init__(self) -> None:
-        self.log = Log()
+        self.log = log
         self.tempdir = tempfile.TemporaryDirectory()
         self.current_os = platform.system()
 
@@ -173,30 +196,16 @@ class File:
         If no corresponding file extension exists, it returns '.bin' as the file extension.
         """
         self.log.info(f"API response content type: {content_type}")
-        extensions = {
-            "image/jpeg": ".jpg",
-            "image/png": ".png",
-            "image/gif": ".gif",
-            "image/bmp": ".bmp",
-            "audio/mp3": ".mp3",
-            "audio/wav": ".wav",
-            "audio/aac": ".aac",
-            "video/mp4": ".mp4",
-            "video/avi": ".avi",
-            "video/mkv": ".mkv",
-            "text/html": ".html",
-            "text/plain": ".txt",
-            "text/javascript": ".js",
-            "application/pdf": ".pdf",
-            "application/json": ".json",
-            "application/xml": ".xml",
-            "application/csv": ".csv",
-            "application/x-zip-compressed": ".zip",
-        }
-        ext: str = None
-        for extension in extensions:
+        # Most content types are a bare media type plus optional parameters,
+        # ex: "application/json; charset=utf-8", so try a direct lookup first.
+        media_type = content_type.partition(";")[0].strip().lower()
+        ext: str = _EXTENSIONS.get(media_type)
+        if ext:
+            return ext
+
+        for extension in _EXTENSIONS:
             if extension in content_type:
-                ext = extensions[extension]
+                ext = _EXTENSIONS[extension]
 
         if ext:
             return ext
@@ -8,6 +8,11 @@ from ..request import Request as CollectionRequest
 from ..template import CustomTemplate
 from .logger import Log
 
+log = Log()
+
+# The pattern looks for ${...} that's not surrounded by quotes
+_UNQUOTED_PLACEHOLDER = re.compile(r'(?<!")(\$\{[^}]+\})(?!")')
+
 
 class Request(Session):
     def __init__(
@@ -18,7 +23,7 @@ class Request(Session):
     ) -> None:
         super().__init__()
         self._request: CollectionRequest = request
-        self.log: Log = Log()
+        self.log: Log = log
         self.timeout: Timeout = timeout
         self.stream: bool = stream
         self.url: str = self._request.url.base_url
@@ -55,8 +60,9 @@ class Request(Session):
         Returns:
             None
         """
-        if self._request.url.params:
-            text = json.dumps(self._request.url.params)
+        url_params = self._request.url.params
+        if url_params:
+            text = json.dumps(url_params)
             template: str = CustomTemplate(text).safe_substitute(params)
             params = {
                 key: value
@@ -90,30 +96,22 @@ class Request(Session):
         Returns:
             None
         """
-        # The pattern looks for ${...} that's not surrounded by quotes
-        pattern = r'(?<!")(\$\{[^}]+\})(?!")'
         # Replacement pattern that adds quotes around the matched pattern
         if with_quuotes:
             replacement = r'"\1"'
         else:
             replacement = r"\1"
-        raw = (
-            re.sub(pattern, replacement, self._request.body.raw)
-            if self._request.body.raw
-            else None
-        )
+        raw = self._request.body.raw or None
+        # Most raw bodies carry no placeholders, skip the regex for those.
+        if raw and "${" in raw:
+            raw = _UNQUOTED_PLACEHOLDER.sub(replacement, raw)
 
-        formdata = (
-            json.dumps(self._request.body.formdata_as_dict)
-            if self._request.body.formdata_as_dict
-            else None
-        )
+        # The *_as_dict properties rebuild their dict on every access.
+        formdata_as_dict = self._request.body.formdata_as_dict
+        formdata = json.dumps(formdata_as_dict) if formdata_as_dict else None
 
-        urlencoded = (
-            json.dumps(self._request.body.urlencoded_as_dict)
-            if self._request.body.urlencoded_as_dict
-            else None
-        )
+        urlencoded_as_dict = self._request.body.urlencoded_as_dict
+        urlencoded = json.dumps(urlencoded_as_dict) if urlencoded_as_dict else None
 
         options_list = [
             formdata,
@@ -162,7 +160,7 @@ class Request(Session):
             data = self.body
             timeout = self.timeout
             stream = self.stream
-            auth = request.auth.http_auth
+            auth = request.auth.http_auth if request.auth else None
             prepare_cookies = self.prepare_cookies
 
             self.log.request(url=url)
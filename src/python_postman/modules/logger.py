@@ -21,16 +21,16 @@ class Log(Logger):
         """
         Logs the request
         """
-        self.info(f"{message} Requesting data from: {url}")
+        self.info("{} Requesting data from: {}", message, url)
 
     def raise_error(self, url: str, response: Response) -> None:
         """
         Logs the api url response error text, status code -
         headers and raises for status.
         """
-        self.error(f"{url} response text: {response.text}")
-        self.error(f"{url} response code: {response.status_code}")
-        self.error(f"{url} response headers: {response.headers}")
+        self.error("{} response text: {}", url, response.text)
+        self.error("{} response code: {}", url, response.status_code)
+        self.error("{} response headers: {}", url, response.headers)
         response.raise_for_status()
 
     def errors(self, url: str, response: Response) -> None:
@@ -38,12 +38,12 @@ class Log(Logger):
         Logs the api url response error text, status code -
         headers and raises for status.
         """
-        self.error(f"{url} response text: {response.text}")
-        self.error(f"{url} response code: {response.status_code}")
-        self.error(f"{url} response headers: {response.headers}")
+        self.error("{} response text: {}", url, response.text)
+        self.error("{} response code: {}", url, response.status_code)
+        self.error("{} response headers: {}", url, response.headers)
 
     def successful(self, url: str, message: str = "->") -> None:
         """
         Logs the successful api requests.
         """
-        self.info(f"{message} Response sucessful from: {url}")
+        self.info("{} Response sucessful from: {}", message, url)
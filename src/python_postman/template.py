@@ -3,3 +3,9 @@ from string import Template
 
 class CustomTemplate(Template):
     idpattern = r"[a-z][\.\-_a-z0-9]*"
+
+    def safe_substitute(self, *args, **kws) -> str:
+        # Without a "$" there are no placeholders, skip the regex pass.
+        if "$" not in self.template:
+            return self.template
+        return super().safe_substitute(*args, **kws)
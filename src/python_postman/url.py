@@ -4,6 +4,8 @@ from .config import Url, Param, Variable
 
 
 class Variable:
+    __slots__ = ("key", "value", "description")
+
     def __init__(self, variable: Variable) -> None:
         self.key: str = variable.key
         self.value: str = variable.value
@@ -11,6 +13,8 @@ class Variable:
 
 
 class Param:
+    __slots__ = ("key", "value", "description", "disabled")
+
     def __init__(self, param: Param) -> None:
         self.key: str = param.key
         self.value: str = param.value
@@ -32,18 +36,15 @@ class Url:
     def base(self) -> str:
         """
         This property returns a complete URL from the provided host and path.
-        If no protocol is given, it defaults to 'https://'.
+        The protocol is expected to be part of the host, ex: {{baseUrl}}.
         Raises an AssertionError if no host or path are found in the postman collection.
         """
         assert self.host and self.path, print(
             "Error: No host or path were found in the postman collection."
         )
-        protocol = f"{self.protocol}" if self.protocol else "https://"
-        host = ".".join(self.host) + "/"
+        host = ".".join(self.host)
         path = "/".join(self.update_path())
-        url = "".join([protocol, host, path])
-        url = "".join([host, path])
-        return url
+        return "/".join([host, path])
 
     @property
     def params(self) -> Dict[str, str]:
@@ -5,6 +5,10 @@ from string import Template
 from .template import CustomTemplate
 from .config import Variables
 
+_API_TAGS_KEYS = frozenset({"API_TAGS", "TAGS", "TAG"})
+_S3_PREFIX_KEYS = frozenset({"S3_PREFIX", "PREFIX"})
+_MODEL_NAME_KEYS = frozenset({"MODEL_NAME", "MODEL"})
+
 
 class Variables:
     def __init__(self, variables: Variables) -> None:
@@ -31,7 +35,7 @@ class Variables:
         """
         if self.variables:
             for variable in self.variables:
-                if variable.key.upper() in ["API_TAGS", "TAGS", "TAG"]:
+                if variable.key.upper() in _API_TAGS_KEYS:
                     return variable.value.split(",")
         return []
 
@@ -44,7 +48,7 @@ class Variables:
         """
         if self.variables:
             for variable in self.variables:
-                if variable.key.upper() in ["S3_PREFIX", "PREFIX"]:
+                if variable.key.upper() in _S3_PREFIX_KEYS:
                     s3_prefix = CustomTemplate(variable.value).safe_substitute(**kwargs)
                     return s3_prefix
 
@@ -58,5 +62,5 @@ class Variables:
         """
         if self.variables:
             for variable in self.variables:
-                if variable.key.upper() in ["MODEL_NAME", "MODEL"]:
+                if variable.key.upper() in _MODEL_NAME_KEYS:
                     return variable.value